@@ -14,6 +14,8 @@ import os
 from retry_requests import retry
 import requests
 import json
+import threading
+from single_flight import SingleFlightHdl
 
 
 #***********************************************************************
@@ -24,6 +26,9 @@ class OpenMeteoHdl():
         :Class name: OpenMeteoHdl
         :Descr: Request data from meteo service: https://open-meteo.com/
     """
+    # Shared by all instances, so every session in the process joins the same in-flight request
+    _single_flight = SingleFlightHdl()
+
     def __init__(self, forecast_hours:int):
         """
         Initialize the OpenMeteoHdl instance with necessary parameters.
@@ -61,6 +66,32 @@ class OpenMeteoHdl():
     def fetch_weather_data(self):
         """
             Fetch the weather data from the Open-Meteo API.
+            Identical concurrent lookups are coalesced into a single upstream request.
+                :return: DataFrame with hourly weather data
+        """
+        hourly_dataframe, shared = OpenMeteoHdl._single_flight.do(self.__request_key(), self.__fetch_weather_data)
+        if hourly_dataframe is None:
+            return None
+        if shared:
+            print(f"[🔗][api_handlers.py/OpenMeteoHdl/fetch_weather_data] --> Joined in-flight request for {self.latitude}, {self.longitude}")
+        # The stored DataFrame is shared and read-only, every caller (leader included) gets its own copy
+        return hourly_dataframe.copy()
+
+    def __request_key(self) -> tuple:
+        """
+            Build a normalized key from the request parameters.
+                :return: tuple identifying the request
+        """
+        return (self.url,
+                round(float(self.params["latitude"]), 4),
+                round(float(self.params["longitude"]), 4),
+                tuple(sorted(self.params["hourly"])),
+                self.params["timezone"],
+                int(self.params["forecast_hours"]))
+
+    def __fetch_weather_data(self):
+        """
+            Request the weather data from the Open-Meteo API and save it to JSON.
                 :return: DataFrame with hourly weather data
         """
         try:
@@ -139,13 +170,15 @@ class OpenMeteoHdl():
                 :param dataframe: The pandas DataFrame containing weather data.
                 :param filename: The name of the file to save the data to.
         """
+        # Write to a temporary file and swap it in, readers never see a missing or partial file
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            if os.path.exists(filename):
-                os.remove(filename)
-                print(f"[🗑️][api_handlers.py/OpenMeteoHdl/save_to_json] --> File {filename} deleted before loading new data.")
-            dataframe.to_json(filename, orient='records', lines=True)
+            dataframe.to_json(tmp_filename, orient='records', lines=True)
+            os.replace(tmp_filename, filename)
             print(f"[✅][api_handlers.py/OpenMeteoHdl/save_to_json] --> Wather data saved in: {filename}")
         except Exception as e:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
             print(f"[❌][api_handlers.py/OpenMeteoHdl/save_to_json] --> Saving data in JSON file not possible! Error: {e}")
 
     def __get_location_data(self,location_data: str)-> list:
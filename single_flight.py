@@ -0,0 +1,62 @@
+#***********************************************************************
+# MODULE: single_flight
+# SCOPE:  Coalesce identical concurrent requests
+# REV: 1.0
+#
+# Created by: Codreanu Dan
+
+#***********************************************************************
+# IMPORTS:
+import threading
+
+
+#***********************************************************************
+# CONTENT: SingleFlightHdl
+# INFO:    Coalesce identical concurrent requests into one upstream call
+class SingleFlightHdl():
+    """
+        :Class name: SingleFlightHdl
+        :Descr: Coalesce identical concurrent requests into one upstream call.
+                The first caller for a key runs the request, every other caller
+                arriving while it is in flight waits and receives the same result.
+    """
+    def __init__(self):
+        """
+            Initialize the in-flight calls table and the lock guarding it.
+        """
+        self.__lock = threading.Lock()
+        self.__in_flight = {}
+
+    def do(self, key, fn):
+        """
+            Run fn once per key for all concurrent callers.
+                :param key: Hashable key identifying the request.
+                :param fn: Callable without arguments performing the request.
+                :return: (result of fn, True if this caller shared another caller's result)
+        """
+        with self.__lock:
+            call = self.__in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self.__in_flight[key] = call
+
+        if not leader:
+            call["done"].wait()
+        else:
+            try:
+                call["result"] = fn()
+            except Exception as e:
+                call["error"] = e
+            finally:
+                # Drop the key before waking waiters so later callers start a fresh request
+                with self.__lock:
+                    del self.__in_flight[key]
+                call["done"].set()
+
+        if call["error"] is not None:
+            if leader:
+                raise call["error"]
+            # Waiters get their own exception, re-raising the shared one would mix tracebacks between threads
+            raise RuntimeError(f"In-flight request for {key} failed: {call['error']}") from call["error"]
+        return call["result"], not leader
@@ -0,0 +1,120 @@
+#***********************************************************************
+# MODULE: test_single_flight
+# SCOPE:  Tests for single_flight.SingleFlightHdl
+# REV: 1.0
+#
+# Created by: Codreanu Dan
+
+#***********************************************************************
+# IMPORTS:
+import os
+import sys
+import threading
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from single_flight import SingleFlightHdl
+
+
+#***********************************************************************
+# CONTENT: helpers
+def run_concurrently(single_flight, key, fn, callers):
+    """
+        Call single_flight.do(key, fn) from several threads at once.
+            :return: list of (result, shared) tuples or raised exceptions
+    """
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def worker():
+        try:
+            outcome = single_flight.do(key, fn)
+        except Exception as e:
+            outcome = e
+        with outcomes_lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return outcomes
+
+
+def blocking_fn(release, calls, result=None, error=None):
+    """
+        Build a stub request that counts its calls and blocks until release is set.
+    """
+    def fn():
+        calls.append(1)
+        release.wait(timeout=5)
+        if error is not None:
+            raise error
+        return result
+    return fn
+
+
+#***********************************************************************
+# CONTENT: tests
+def test_concurrent_callers_make_one_call():
+    single_flight = SingleFlightHdl()
+    release, calls = threading.Event(), []
+    fn = blocking_fn(release, calls, result="forecast")
+
+    threading.Timer(0.5, release.set).start()
+    outcomes = run_concurrently(single_flight, "key", fn, callers=20)
+
+    assert len(calls) == 1
+    assert len(outcomes) == 20
+    assert all(result == "forecast" for result, _ in outcomes)
+    assert sum(shared for _, shared in outcomes) == 19
+
+
+def test_different_keys_do_not_share_a_call():
+    single_flight = SingleFlightHdl()
+    release, calls = threading.Event(), []
+    fn = blocking_fn(release, calls, result="forecast")
+    outcomes = []
+
+    threads = [threading.Thread(target=lambda k=k: outcomes.append(single_flight.do(k, fn)))
+               for k in ("key_a", "key_b")]
+    for thread in threads:
+        thread.start()
+    threading.Timer(0.5, release.set).start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 2
+    assert not any(shared for _, shared in outcomes)
+
+
+def test_error_reaches_every_waiter():
+    single_flight = SingleFlightHdl()
+    release, calls = threading.Event(), []
+    error = ValueError("upstream down")
+    fn = blocking_fn(release, calls, error=error)
+
+    threading.Timer(0.5, release.set).start()
+    outcomes = run_concurrently(single_flight, "key", fn, callers=10)
+
+    assert len(calls) == 1
+    assert len(outcomes) == 10
+    assert all(isinstance(outcome, Exception) for outcome in outcomes)
+    # Leader gets the original error, waiters get their own exception chained to it
+    assert sum(outcome is error for outcome in outcomes) == 1
+    assert all(outcome.__cause__ is error for outcome in outcomes if outcome is not error)
+
+
+def test_key_is_released_after_error():
+    single_flight = SingleFlightHdl()
+
+    def failing():
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", failing)
+
+    result, shared = single_flight.do("key", lambda: "forecast")
+    assert result == "forecast"
+    assert shared is False